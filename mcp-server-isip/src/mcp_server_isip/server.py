@@ -7,14 +7,23 @@ enabling AI assistants to make phone calls, generate TTS prompts, and transcribe
 """
 
 import asyncio
+import concurrent.futures
+import io
+import itertools
 import json
 import os
+import re
 import sys
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.stdio import stdio_server
 from mcp.types import (
     Tool,
@@ -26,19 +35,32 @@ from mcp.types import (
     PromptMessage,
     GetPromptResult,
 )
-from pydantic import BaseModel, Field
+from dotenv import load_dotenv
 
 # Add parent SDK to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "sdk" / "python"))
 
 try:
-    from siptester import Sippy, VoiceService, SipHeaders, CallResponse, quick_call
+    from siptester import Sippy, VoiceService, SipHeaders, CallResponse
 except ImportError:
     print("ERROR: iSIP SDK not found. Please install: cd sdk/python && pip install -e .", file=sys.stderr)
     sys.exit(1)
 
 
-class CallRecord(BaseModel):
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load the project .env file once per process."""
+    env_path = Path(__file__).parent.parent.parent.parent / ".env"
+    if env_path.exists():
+        load_dotenv(env_path)
+
+
+TTS_VOICES = ("alloy", "nova", "shimmer", "echo", "fable", "onyx")
+DEFAULT_VOICE = "alloy"
+
+
+@dataclass(slots=True)
+class CallRecord:
     """Record of a call made through the MCP server."""
     id: int
     timestamp: str
@@ -51,18 +73,86 @@ class CallRecord(BaseModel):
     error: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class Config:
+    """Environment-derived server configuration, resolved once at startup."""
+    sip_gateway: str
+    openai_key: Optional[str] = None
+    deepgram_key: Optional[str] = None
+    sip_username: Optional[str] = None
+    sip_password: Optional[str] = None
+    resource_limit: int = 100
+    max_concurrent_calls: int = 8
+    
+    @classmethod
+    def from_env(cls) -> "Config":
+        return cls(
+            sip_gateway=os.getenv("SIP_GATEWAY", "2g0282esbg2.sip.livekit.cloud"),
+            openai_key=os.getenv("OPENAI_API_KEY"),
+            deepgram_key=os.getenv("DEEPGRAM_API_KEY"),
+            sip_username=os.getenv("SIP_USERNAME"),
+            sip_password=os.getenv("SIP_PASSWORD"),
+            resource_limit=int(os.getenv("ISIP_RESOURCE_LIMIT", "100")),
+            max_concurrent_calls=int(os.getenv("ISIP_MAX_CONCURRENT_CALLS", "8")),
+        )
+    
+    def missing_vars(self) -> list[str]:
+        """Names of required environment variables that are not set."""
+        required = {
+            "OPENAI_API_KEY": self.openai_key,
+            "DEEPGRAM_API_KEY": self.deepgram_key,
+            "SIP_USERNAME": self.sip_username,
+            "SIP_PASSWORD": self.sip_password,
+        }
+        return [name for name, value in required.items() if not value]
+
+
+@dataclass
+class PendingCall:
+    """A call submitted via start_call that has not been collected yet."""
+    future: concurrent.futures.Future
+    phone: str
+    prompt: str
+    started: float
+
+
 class MCPServerState:
     """State management for the MCP server."""
     
     def __init__(self):
         self.calls: list[CallRecord] = []
+        self.calls_by_id: dict[int, CallRecord] = {}
         self.call_counter = 0
+        self._resources: list[Resource] = []
+        self._sippy_cache: dict[tuple, Sippy] = {}
+        self._sippy_lock = threading.Lock()
+        self._in_flight: dict[int, PendingCall] = {}
         
         # Load environment variables first
-        from dotenv import load_dotenv
-        env_path = Path(__file__).parent.parent.parent.parent / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
+        _load_env()
+        self.config = Config.from_env()
+        # Dedicated pool so long-running SIP calls never starve the loop's default executor
+        self.call_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.max_concurrent_calls,
+            thread_name_prefix="sip-call",
+        )
+        self._sip_to_template = f"sip:{{phone}}@{self.config.sip_gateway}"
+        self.missing = self.config.missing_vars()
+        self.env_ok = not self.missing
+        if not self.env_ok:
+            print(f"WARNING: Calls disabled, missing: {', '.join(self.missing)}", file=sys.stderr)
+        
+        # Prebuild voice services; without keys they stay unset and the per-call
+        # construction in get_sippy reports the missing key as before
+        self.tts_services: dict[str, VoiceService] = {}
+        self.stt_service: Optional[VoiceService] = None
+        if self.config.openai_key:
+            self.tts_services = {
+                v: VoiceService("openai", "tts-1", api_key=self.config.openai_key, voice=v)
+                for v in TTS_VOICES
+            }
+        if self.config.deepgram_key:
+            self.stt_service = VoiceService("deepgram", "nova-2", api_key=self.config.deepgram_key)
         
         # Always use /tmp for MCP server to avoid permission issues
         # Claude Desktop runs in restricted environment
@@ -78,11 +168,14 @@ class MCPServerState:
             self.output_dir = Path(tempfile.mkdtemp(prefix="isip_"))
             print(f"Using temporary directory: {self.output_dir}", file=sys.stderr)
     
-    def add_call(self, result: CallResponse, phone: str, prompt: str) -> CallRecord:
-        """Add a call to the history."""
-        self.call_counter += 1
+    def add_call(
+        self, result: CallResponse, phone: str, prompt: str, call_id: Optional[int] = None
+    ) -> CallRecord:
+        """Add a call to the history (under a reserved ``call_id`` if one was handed out)."""
+        if call_id is None:
+            call_id = self.reserve_call_id()
         record = CallRecord(
-            id=self.call_counter,
+            id=call_id,
             timestamp=datetime.now().isoformat(),
             phone=phone,
             prompt=prompt,
@@ -93,16 +186,93 @@ class MCPServerState:
             error=result.error,
         )
         self.calls.append(record)
+        self.calls_by_id[record.id] = record
+        self._add_resources(record)
         return record
     
+    def reserve_call_id(self) -> int:
+        """Allocate the next call ID."""
+        self.call_counter += 1
+        return self.call_counter
+    
+    def start_call(self, sippy: Sippy, target: SipHeaders, prompt: str, timeout: float) -> int:
+        """Submit a call to the call executor and return its ID immediately."""
+        call_id = self.reserve_call_id()
+        future = self.call_executor.submit(sippy.call, target, prompt=prompt, timeout=timeout)
+        self._in_flight[call_id] = PendingCall(
+            future=future, phone=target.phone, prompt=prompt, started=time.monotonic()
+        )
+        return call_id
+    
+    def collect_finished(self) -> None:
+        """Move completed in-flight calls into the call history."""
+        for call_id, pending in list(self._in_flight.items()):
+            if not pending.future.done():
+                continue
+            del self._in_flight[call_id]
+            try:
+                result = pending.future.result()
+            except Exception as e:
+                result = CallResponse(established=False, duration=0.0, error=f"Call failed: {e}")
+            self.add_call(result, pending.phone, pending.prompt, call_id=call_id)
+    
+    def _add_resources(self, call: CallRecord) -> None:
+        """Publish the MCP resource for a call (one per call, covering transcript and recording)."""
+        self._resources.append(
+            Resource(
+                uri=f"call://call_{call.id}",
+                name=f"Call {call.id}",
+                mimeType="application/json",
+                description=f"Transcript and recording of call to {call.phone} at {call.timestamp}",
+            )
+        )
+    
     def get_call(self, call_id: int) -> Optional[CallRecord]:
         """Get a specific call by ID."""
-        for call in self.calls:
-            if call.id == call_id:
-                return call
-        return None
+        return self.calls_by_id.get(call_id)
+    
+    def sip_to(self, phone: str) -> str:
+        """Build the SIP URI for a phone number on the configured gateway."""
+        return self._sip_to_template.format(phone=phone)
+    
+    def get_sippy(self, voice: str) -> Sippy:
+        """Get a shared Sippy client for the given TTS voice, creating it on first use."""
+        if voice not in TTS_VOICES:
+            voice = DEFAULT_VOICE
+        key = (voice, "tts-1", "nova-2", str(self.output_dir))
+        # May be reached from executor threads as well as the event loop
+        with self._sippy_lock:
+            sippy = self._sippy_cache.get(key)
+            if sippy is None:
+                tts = self.tts_services.get(voice) or VoiceService(
+                    "openai", "tts-1", api_key=self.config.openai_key, voice=voice
+                )
+                stt = self.stt_service or VoiceService(
+                    "deepgram", "nova-2", api_key=self.config.deepgram_key
+                )
+                sippy = Sippy(
+                    voice_service=tts,
+                    transcription_service=stt,
+                    output_dir=self.output_dir,
+                )
+                self._sippy_cache[key] = sippy
+            return sippy
 
 
+_TEST_CALL_TEMPLATE = (
+    "Make a test call to {phone} with the message: 'Hello, this is a test call from iSIP MCP "
+    "server. Please acknowledge if you can hear this message.'"
+)
+_AGENT_HANDOFF_TEMPLATE = (
+    "Call {phone} and perform this agent handoff: "
+    "Hello, this is an automated agent handoff. "
+    "I'm passing you the following task: {task}. "
+    "{context_part}"
+    "Please acknowledge and proceed with the task."
+)
+
+_RESOURCE_URI_RE = re.compile(r"(call|transcript|recording)://call_(\d+)/?$")
+
 # Initialize server and state
 app = Server("mcp-server-isip")
 state = MCPServerState()
@@ -166,6 +336,63 @@ async def list_tools() -> list[Tool]:
                 "required": ["phone", "prompt"],
             },
         ),
+        Tool(
+            name="start_call",
+            description=(
+                "Start a SIP phone call in the background and return its call ID immediately. "
+                "Takes the same arguments as make_call. "
+                "Use get_call_status to check progress and fetch the result."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "phone": {
+                        "type": "string",
+                        "description": "Phone number to call (E.164 format, e.g., +19999999999)",
+                    },
+                    "prompt": {
+                        "type": "string",
+                        "description": "Text to speak during the call (will be converted to audio via TTS)",
+                    },
+                    "timeout": {
+                        "type": "number",
+                        "description": "Call timeout in seconds (default: 30)",
+                        "default": 30.0,
+                    },
+                    "voice": {
+                        "type": "string",
+                        "description": "TTS voice to use (alloy, nova, shimmer, echo, fable, onyx)",
+                        "default": "alloy",
+                    },
+                },
+                "required": ["phone", "prompt"],
+            },
+        ),
+        Tool(
+            name="get_call_status",
+            description=(
+                "Get the status of a call started with start_call. "
+                "Returns progress while the call is running, or the full result once it finishes."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "call_id": {
+                        "type": "number",
+                        "description": "Call ID returned by start_call",
+                    },
+                },
+                "required": ["call_id"],
+            },
+        ),
+        Tool(
+            name="list_in_flight_calls",
+            description="List calls started with start_call that are still in progress.",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+            },
+        ),
         Tool(
             name="list_recordings",
             description=(
@@ -206,85 +433,160 @@ async def list_tools() -> list[Tool]:
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls."""
-    
-    if name == "make_call":
-        return await handle_make_call(arguments)
-    elif name == "quick_call":
-        return await handle_quick_call(arguments)
-    elif name == "list_recordings":
-        return await handle_list_recordings(arguments)
-    elif name == "get_transcript":
-        return await handle_get_transcript(arguments)
-    else:
+    handler = _SYNC_TOOL_HANDLERS.get(name)
+    if handler is not None:
+        return handler(arguments)
+    async_handler = _ASYNC_TOOL_HANDLERS.get(name)
+    if async_handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return await async_handler(arguments)
+
+
+def _make_target(phone: str) -> SipHeaders:
+    """Build SIP headers for a phone number using the server config."""
+    return SipHeaders(
+        sip_to=state.sip_to(phone),
+        auth_user=state.config.sip_username,
+        auth_password=state.config.sip_password,
+    )
+
+
+def _missing_env_response() -> list[TextContent]:
+    """Fail fast instead of attempting SIP/TTS setup that cannot succeed."""
+    return [
+        TextContent(
+            type="text",
+            text=f"Error: missing required environment variables: {', '.join(state.missing)}",
+        )
+    ]
+
+
+def _format_call(record: CallRecord) -> str:
+    """Format a completed call for a tool response."""
+    if record.established:
+        return (
+            f"✓ Call completed successfully!\n\n"
+            f"Call ID: {record.id}\n"
+            f"Phone: {record.phone}\n"
+            f"Duration: {record.duration:.2f} seconds\n"
+            f"Recording: {record.recording_path}\n\n"
+            f"Transcript:\n{record.transcript or '[No transcript available]'}"
+        )
+    return (
+        f"✗ Call failed\n\n"
+        f"Phone: {record.phone}\n"
+        f"Error: {record.error or 'Unknown error'}"
+    )
 
 
 async def handle_make_call(args: dict) -> list[TextContent]:
     """Handle make_call tool."""
+    if not state.env_ok:
+        return _missing_env_response()
+    
     phone = args["phone"]
     prompt = args["prompt"]
     timeout = args.get("timeout", 30.0)
-    voice = args.get("voice", "alloy")
+    voice = args.get("voice", DEFAULT_VOICE)
     
     try:
-        # Configure services
-        openai = VoiceService("openai", "tts-1", voice=voice)
-        deepgram = VoiceService("deepgram", "nova-2")
-        
-        sippy = Sippy(
-            voice_service=openai,
-            transcription_service=deepgram,
-            output_dir=state.output_dir,
-        )
-        
-        # Configure target
-        gateway = os.getenv("SIP_GATEWAY", "2g0282esbg2.sip.livekit.cloud")
-        target = SipHeaders(sip_to=f"sip:{phone}@{gateway}")
+        sippy = state.get_sippy(voice)
+        target = _make_target(phone)
         
         # Make the call (run in thread to avoid blocking)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,
+            state.call_executor,
             lambda: sippy.call(target, prompt=prompt, timeout=timeout)
         )
         
         # Record the call
         record = state.add_call(result, phone, prompt)
         
-        # Format response
-        if result.established:
-            response = (
-                f"✓ Call completed successfully!\n\n"
-                f"Call ID: {record.id}\n"
-                f"Phone: {phone}\n"
-                f"Duration: {result.duration:.2f} seconds\n"
-                f"Recording: {result.recording}\n\n"
-                f"Transcript:\n{result.transcript or '[No transcript available]'}"
-            )
-        else:
-            response = (
-                f"✗ Call failed\n\n"
-                f"Phone: {phone}\n"
-                f"Error: {result.error or 'Unknown error'}"
-            )
-        
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text=_format_call(record))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error making call: {str(e)}")]
 
 
+def handle_start_call(args: dict) -> list[TextContent]:
+    """Handle start_call tool."""
+    if not state.env_ok:
+        return _missing_env_response()
+    
+    phone = args["phone"]
+    prompt = args["prompt"]
+    timeout = args.get("timeout", 30.0)
+    voice = args.get("voice", DEFAULT_VOICE)
+    
+    try:
+        sippy = state.get_sippy(voice)
+        call_id = state.start_call(sippy, _make_target(phone), prompt, timeout)
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error starting call: {str(e)}")]
+    
+    response = (
+        f"⏳ Call started\n\n"
+        f"Call ID: {call_id}\n"
+        f"Phone: {phone}\n\n"
+        f"Use get_call_status with this call ID to check on it."
+    )
+    return [TextContent(type="text", text=response)]
+
+
+def handle_get_call_status(args: dict) -> list[TextContent]:
+    """Handle get_call_status tool."""
+    call_id = int(args["call_id"])
+    state.collect_finished()
+    
+    pending = state._in_flight.get(call_id)
+    if pending:
+        response = (
+            f"⏳ Call #{call_id} in progress\n\n"
+            f"Phone: {pending.phone}\n"
+            f"Elapsed: {time.monotonic() - pending.started:.1f}s"
+        )
+        return [TextContent(type="text", text=response)]
+    
+    call = state.get_call(call_id)
+    if not call:
+        return [TextContent(type="text", text=f"Call #{call_id} not found")]
+    return [TextContent(type="text", text=_format_call(call))]
+
+
+def handle_list_in_flight_calls(args: dict) -> list[TextContent]:
+    """Handle list_in_flight_calls tool."""
+    state.collect_finished()
+    
+    if not state._in_flight:
+        return [TextContent(type="text", text="No calls in progress.")]
+    
+    now = time.monotonic()
+    lines = ["Calls In Progress:\n"]
+    for call_id, pending in state._in_flight.items():
+        lines.append(f"⏳ Call #{call_id} - {pending.phone} ({now - pending.started:.1f}s)")
+    
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
 async def handle_quick_call(args: dict) -> list[TextContent]:
     """Handle quick_call tool."""
+    if not state.env_ok:
+        return _missing_env_response()
+    
     phone = args["phone"]
     prompt = args["prompt"]
     
     try:
+        # Same shared client and prebuilt services as make_call, with default settings
+        sippy = state.get_sippy(DEFAULT_VOICE)
+        target = _make_target(phone)
+        
         # Make the call
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,
-            lambda: quick_call(phone=phone, prompt=prompt)
+            state.call_executor,
+            lambda: sippy.call(target, prompt=prompt)
         )
         
         # Record the call
@@ -305,31 +607,31 @@ async def handle_quick_call(args: dict) -> list[TextContent]:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_list_recordings(args: dict) -> list[TextContent]:
+def handle_list_recordings(args: dict) -> list[TextContent]:
     """Handle list_recordings tool."""
-    limit = args.get("limit", 10)
-    
-    recent_calls = state.calls[-limit:]
+    state.collect_finished()
+    limit = min(int(args.get("limit", 10)), len(state.calls))
     
-    if not recent_calls:
+    if limit <= 0:
         return [TextContent(type="text", text="No recordings yet. Make a call first!")]
     
-    lines = ["Recent Calls:\n"]
-    for call in reversed(recent_calls):  # Most recent first
-        status = "✓" if call.established else "✗"
-        lines.append(
-            f"{status} Call #{call.id} - {call.phone}\n"
+    buf = io.StringIO()
+    buf.write("Recent Calls:\n")
+    for call in itertools.islice(reversed(state.calls), limit):  # Most recent first
+        buf.write(
+            f"\n{'✓' if call.established else '✗'} Call #{call.id} - {call.phone}\n"
             f"   Time: {call.timestamp}\n"
             f"   Duration: {call.duration:.2f}s\n"
             f"   Transcript: {(call.transcript or '[None]')[:80]}...\n"
         )
     
-    return [TextContent(type="text", text="\n".join(lines))]
+    return [TextContent(type="text", text=buf.getvalue())]
 
 
-async def handle_get_transcript(args: dict) -> list[TextContent]:
+def handle_get_transcript(args: dict) -> list[TextContent]:
     """Handle get_transcript tool."""
     call_id = int(args["call_id"])
+    state.collect_finished()
     call = state.get_call(call_id)
     
     if not call:
@@ -349,51 +651,61 @@ async def handle_get_transcript(args: dict) -> list[TextContent]:
     return [TextContent(type="text", text=response)]
 
 
+# Tools whose handlers only touch in-memory state (or just submit work to the
+# call executor) are plain functions, so they complete without suspending.
+_SYNC_TOOL_HANDLERS: dict[str, Callable[[dict], list[TextContent]]] = {
+    "start_call": handle_start_call,
+    "get_call_status": handle_get_call_status,
+    "list_in_flight_calls": handle_list_in_flight_calls,
+    "list_recordings": handle_list_recordings,
+    "get_transcript": handle_get_transcript,
+}
+_ASYNC_TOOL_HANDLERS: dict[str, Callable[[dict], Awaitable[list[TextContent]]]] = {
+    "make_call": handle_make_call,
+    "quick_call": handle_quick_call,
+}
+
+
 @app.list_resources()
 async def list_resources() -> list[Resource]:
-    """List available resources (recordings, transcripts)."""
-    resources = []
-    
-    for call in state.calls:
-        # Add transcript resource
-        resources.append(
-            Resource(
-                uri=f"transcript://call_{call.id}",
-                name=f"Call {call.id} Transcript",
-                mimeType="text/plain",
-                description=f"Transcript of call to {call.phone} at {call.timestamp}",
-            )
-        )
-        
-        # Add recording resource if available
-        if call.recording_path and call.recording_path.exists():
-            resources.append(
-                Resource(
-                    uri=f"recording://call_{call.id}",
-                    name=f"Call {call.id} Recording",
-                    mimeType="audio/wav",
-                    description=f"Audio recording of call to {call.phone}",
-                )
-            )
+    """List resources for the most recent calls.
     
-    return resources
+    Capped at ISIP_RESOURCE_LIMIT so the listing stays bounded over a long
+    session; older calls remain readable by URI.
+    """
+    state.collect_finished()
+    limit = state.config.resource_limit
+    return state._resources[-limit:] if limit > 0 else []
 
 
 @app.read_resource()
-async def read_resource(uri: str) -> str:
+async def read_resource(uri: str) -> list[ReadResourceContents]:
     """Read a resource by URI."""
-    if uri.startswith("transcript://call_"):
-        call_id = int(uri.split("_")[1])
-        call = state.get_call(call_id)
-        if call:
-            return call.transcript or "[No transcript available]"
-    
-    elif uri.startswith("recording://call_"):
-        call_id = int(uri.split("_")[1])
-        call = state.get_call(call_id)
-        if call and call.recording_path:
-            # For now, return path. In future, could return base64 audio
-            return f"Recording path: {call.recording_path}"
+    match = _RESOURCE_URI_RE.match(str(uri))
+    if match:
+        kind, call_id = match.groups()
+        call = state.get_call(int(call_id))
+        if call and kind == "call":
+            recording = call.recording_path if call.recording_path and call.recording_path.exists() else None
+            summary = json.dumps({
+                "id": call.id,
+                "phone": call.phone,
+                "timestamp": call.timestamp,
+                "prompt": call.prompt,
+                "established": call.established,
+                "duration": call.duration,
+                "transcript": call.transcript,
+                "recording_path": str(recording) if recording else None,
+                "error": call.error,
+            })
+            return [ReadResourceContents(content=summary, mime_type="application/json")]
+        elif call and kind == "transcript":
+            transcript = call.transcript or "[No transcript available]"
+            return [ReadResourceContents(content=transcript, mime_type="text/plain")]
+        elif call and call.recording_path and call.recording_path.exists():
+            # Bytes are sent as a base64 blob, so remote clients get the audio
+            audio = await asyncio.to_thread(call.recording_path.read_bytes)
+            return [ReadResourceContents(content=audio, mime_type="audio/wav")]
     
     raise ValueError(f"Resource not found: {uri}")
 
@@ -434,7 +746,7 @@ async def get_prompt(name: str, arguments: dict) -> GetPromptResult:
                     role="user",
                     content=TextContent(
                         type="text",
-                        text=f"Make a test call to {phone} with the message: 'Hello, this is a test call from iSIP MCP server. Please acknowledge if you can hear this message.'"
+                        text=_TEST_CALL_TEMPLATE.format_map({"phone": phone}),
                     ),
                 ),
             ],
@@ -444,14 +756,11 @@ async def get_prompt(name: str, arguments: dict) -> GetPromptResult:
         phone = arguments["phone"]
         task = arguments["task"]
         context = arguments.get("context", "")
-        
-        message = (
-            f"Hello, this is an automated agent handoff. "
-            f"I'm passing you the following task: {task}. "
-        )
-        if context:
-            message += f"Context: {context}. "
-        message += "Please acknowledge and proceed with the task."
+        text = _AGENT_HANDOFF_TEMPLATE.format_map({
+            "phone": phone,
+            "task": task,
+            "context_part": f"Context: {context}. " if context else "",
+        })
         
         return GetPromptResult(
             description="Agent handoff template",
@@ -460,7 +769,7 @@ async def get_prompt(name: str, arguments: dict) -> GetPromptResult:
                     role="user",
                     content=TextContent(
                         type="text",
-                        text=f"Call {phone} and perform this agent handoff: {message}"
+                        text=text,
                     ),
                 ),
             ],
@@ -481,7 +790,11 @@ async def run_server():
 
 def main():
     """Entry point for the MCP server."""
-    asyncio.run(run_server())
+    _load_env()
+    try:
+        asyncio.run(run_server())
+    finally:
+        state.call_executor.shutdown(wait=True)
 
 
 if __name__ == "__main__":
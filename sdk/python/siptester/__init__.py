@@ -1,4 +1,13 @@
-from .client import SipTestClient, SipScenario, CallResult, synthesize_prompt, transcribe_recording
+from .client import (
+    SipTestClient,
+    SipScenario,
+    CallResult,
+    cached_synthesize,
+    clear_tts_cache,
+    synthesize_prompt,
+    transcribe_recording,
+)
+from .streaming import DeepgramStreamer
 from .sippy import Sippy, VoiceService, SipHeaders, CallResponse, quick_call
 
 __all__ = [
@@ -7,7 +16,10 @@ __all__ = [
     "SipScenario",
     "CallResult",
     "synthesize_prompt",
+    "cached_synthesize",
+    "clear_tts_cache",
     "transcribe_recording",
+    "DeepgramStreamer",
     # High-level Sippy API
     "Sippy",
     "VoiceService",
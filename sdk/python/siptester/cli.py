@@ -3,10 +3,13 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
-from .client import CallResult, SipScenario, SipTestClient, synthesize_prompt, transcribe_recording
+from .client import CallResult, SipScenario, SipTestClient, cached_synthesize, transcribe_recording
 
 
 def _add_common(parser: argparse.ArgumentParser) -> None:
@@ -18,22 +21,33 @@ def _add_common(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--verbose", action="store_true", help="Enable debug logging")
 
 
+def _synthesize_to(text: str, cache_root: Path, target: Path, openai_key: str) -> Path:
+    """Render ``text`` through the TTS cache and copy it to ``target``.
+
+    Re-runs without an OpenAI key look for the prompt at ``target``.
+    """
+    # cached_synthesize only returns once the WAV is on disk
+    shutil.copyfile(cached_synthesize(text, cache_root, openai_key), target)
+    return target
+
+
 def handle_call(args: argparse.Namespace) -> int:
-    prompt_file: Path
-    if args.prompt_file:
-        prompt_file = Path(args.prompt_file)
-    elif args.prompt_text:
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    prompt_file: Optional[Path]
+    if args.prompt_text and not args.prompt_file:
         if not args.openai_key:
             raise SystemExit("OPENAI key required to synthesize prompt text")
-        prompt_file = Path(args.output_dir) / "prompt.wav"
-        synthesize_prompt(args.prompt_text, prompt_file, args.openai_key)
+        prompt_file = _synthesize_to(args.prompt_text, output_dir, output_dir / "prompt.wav", args.openai_key)
     else:
-        prompt_file = Path(args.output_dir) / "prompt.wav"
+        candidate = Path(args.prompt_file) if args.prompt_file else output_dir / "prompt.wav"
+        prompt_file = candidate if candidate.exists() else None
 
     scenario = SipScenario(
         phone=args.phone,
-        prompt_file=prompt_file if prompt_file.exists() else None,
-        record_file=Path(args.output_dir) / "response.wav",
+        prompt_file=prompt_file,
+        record_file=output_dir / "response.wav",
         timeout=args.timeout,
     )
 
@@ -55,7 +69,38 @@ def handle_suite(args: argparse.Namespace) -> int:
     data = json.loads(suite_path.read_text())
     default_phone = data.get("phone")
     tests = data["tests"]
-
+    concurrency = max(1, args.concurrency)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    prompt_dir = Path(args.prompt_dir) if args.prompt_dir else None
+
+    # Resolve every prompt up front so TTS never serializes against signalling
+    scenarios: list[tuple[str, SipScenario]] = []
+    for test in tests:
+        phone = test.get("phone") or default_phone
+        if not phone:
+            raise ValueError(f"Test {test['name']} missing phone number")
+        prompt_file: Optional[Path]
+        if prompt_dir and args.openai_key:
+            # Shared cache dir means repeated prompts across tests synthesize once
+            prompt_file = _synthesize_to(test["prompt"], prompt_dir, prompt_dir / f"{test['name']}.wav", args.openai_key)
+        else:
+            if prompt_dir:
+                candidate = prompt_dir / f"{test['name']}.wav"
+            else:
+                candidate = Path(test.get("prompt_file", "prompt.wav"))
+            prompt_file = candidate if candidate.exists() else None
+
+        scenario = SipScenario(
+            phone=phone,
+            prompt_file=prompt_file,
+            record_file=output_dir / f"{test['name']}_response.wav",
+            timeout=args.timeout,
+        )
+        scenarios.append((test["name"], scenario))
+
+    # pjsua allows a single Lib per process, so workers share one client and
+    # account; pjsua multiplexes up to max_calls concurrent calls over it.
     with SipTestClient(
         gateway=args.gateway,
         username=args.user,
@@ -63,27 +108,13 @@ def handle_suite(args: argparse.Namespace) -> int:
         local_ip=args.local_ip,
         local_port=args.local_port,
         log_level=5 if args.verbose else 3,
+        max_calls=concurrency,
     ) as client:
-        for test in tests:
-            phone = test.get("phone") or default_phone
-            if not phone:
-                raise ValueError(f"Test {test['name']} missing phone number")
-            prompt_file: Path
-            if args.prompt_dir:
-                prompt_file = Path(args.prompt_dir) / f"{test['name']}.wav"
-                if args.openai_key:
-                    synthesize_prompt(test["prompt"], prompt_file, args.openai_key)
-            else:
-                prompt_file = Path(test.get("prompt_file", "prompt.wav"))
-
-            scenario = SipScenario(
-                phone=phone,
-                prompt_file=prompt_file if prompt_file.exists() else None,
-                record_file=Path(args.output_dir) / f"{test['name']}_response.wav",
-                timeout=args.timeout,
-            )
-            result = client.run_scenario(scenario)
-            _print_result(result, args, scenario, test_name=test["name"])
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="suite") as pool:
+            results = pool.map(client.run_scenario, [scenario for _, scenario in scenarios])
+            # map() yields in submission order, so output matches the suite file
+            for (name, scenario), result in zip(scenarios, results):
+                _print_result(result, args, scenario, test_name=name)
     return 0
 
 
@@ -118,6 +149,7 @@ def main(argv: list[str] | None = None) -> int:
     suite_p.add_argument("--prompt-dir", default="prompts", help="Directory to store prompts")
     suite_p.add_argument("--output-dir", default="artifacts")
     suite_p.add_argument("--timeout", type=float, default=30.0)
+    suite_p.add_argument("--concurrency", type=int, default=4, help="Number of calls to run in parallel")
     suite_p.add_argument("--openai-key", default=None)
     suite_p.add_argument("--deepgram-key", default=None)
     suite_p.set_defaults(func=handle_suite)
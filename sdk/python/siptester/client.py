@@ -1,132 +1,469 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import shutil
+import struct
+import tempfile
+import threading
 import time
+import warnings
+import zlib
+from concurrent.futures import Future, wait
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
+    import orjson  # optional, faster parsing of Deepgram responses
+except ImportError:  # pragma: no cover - exercised when the "fast" extra isn't installed
+    orjson = None
+
+if TYPE_CHECKING:
     import pjsua as pj
-except ImportError as exc:  # pragma: no cover - only triggered if pj not installed
-    raise RuntimeError(
-        "pjsua Python bindings are required. Install pjproject via Homebrew (brew install pjproject)."
-    ) from exc
 
 log = logging.getLogger(__name__)
 
-
-@dataclass
+# pjsua is imported on first use so TTS/STT helpers and the MCP server's
+# read-only tools work without PJSIP installed
+_pj = None
+
+
+def _get_pj():
+    global _pj
+    if _pj is None:
+        try:
+            import pjsua
+        except ImportError as exc:  # pragma: no cover - only triggered if pj not installed
+            raise RuntimeError(
+                "pjsua Python bindings are required. Install pjproject via Homebrew (brew install pjproject)."
+            ) from exc
+        _pj = pjsua
+    return _pj
+
+_OPENAI_SPEECH_URL = "https://api.openai.com/v1/audio/speech"
+_DEEPGRAM_MODEL = "nova-2"
+_DEEPGRAM_LISTEN_URL = f"https://api.deepgram.com/v1/listen?model={_DEEPGRAM_MODEL}&smart_format=true"
+_GZIP_UPLOAD_THRESHOLD = 256 * 1024
+
+# One pooled session for OpenAI and Deepgram so repeat calls reuse TLS connections
+_SESSION = requests.Session()
+_SESSION.headers["Connection"] = "keep-alive"
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            # TTS and transcription requests are safe to repeat
+            allowed_methods=frozenset({"POST"}),
+            # Hand the final response back so raise_for_status reports it as usual
+            raise_on_status=False,
+        ),
+    ),
+)
+
+_pj_threads = threading.local()
+
+
+def _register_pj_thread(lib: pj.Lib) -> None:
+    """Register the calling thread with pjsua (required before any pjsua call from a new thread)."""
+    # Compare by identity (holding a reference) so a recreated Lib is never mistaken for an old one
+    if getattr(_pj_threads, "lib", None) is lib:
+        return
+    lib.thread_register(threading.current_thread().name)
+    _pj_threads.lib = lib
+
+
+def _mark_pj_thread(lib: pj.Lib) -> None:
+    """Record that pjsua registered the calling thread itself when it created ``lib``."""
+    _pj_threads.lib = lib
+
+
+@dataclass(slots=True)
 class SipScenario:
     phone: str
     prompt_file: Optional[Path] = None
     record_file: Path = Path("response.wav")
     timeout: float = 30.0
+    # Prompt still being synthesized; it starts playing as soon as it resolves
+    prompt_future: Optional[Future] = None
+    # The call is hung up if prompt_future fails or is still pending this long
+    # after prompt_started is set (after dialing if unset); defaults to timeout
+    prompt_timeout: Optional[float] = None
+    # Set when the render leaves the TTS queue, so queueing isn't counted
+    prompt_started: Optional[threading.Event] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CallResult:
     established: bool
     recording: Optional[Path]
     duration: float
+    error: Optional[str] = None
 
 
-def synthesize_prompt(text: str, output_path: Path, openai_api_key: str, voice: str = "alloy") -> None:
-    """Generate a WAV prompt using OpenAI TTS."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    mp3_path = output_path.with_suffix(".mp3")
-    response = requests.post(
-        "https://api.openai.com/v1/audio/speech",
+# Canonical 44-byte PCM WAV header: RIFF chunk, fmt chunk (format 1, channels,
+# rate, byte rate, block align, bits per sample) and the data chunk header
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+# Renders in progress, keyed by their cache path
+_inflight_prompts: dict[Path, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _tts_cache_dir(out_dir: Optional[Path] = None) -> Path:
+    """``$ISIP_TTS_CACHE_DIR`` if set, else ``out_dir/tts_cache``, else a temp-dir cache."""
+    configured = os.getenv("ISIP_TTS_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    if out_dir is not None:
+        return out_dir / "tts_cache"
+    return Path(tempfile.gettempdir()) / "isip_tts_cache"
+
+
+def _tts_cache_key(text: str, voice: str, model: str) -> str:
+    # Includes the output format so a change to the WAV parameters invalidates entries
+    return hashlib.sha256(f"openai|{model}|{voice}|8000|mono|s16|{text}".encode()).hexdigest()
+
+
+def _render_prompt(text: str, output_path: Path, openai_api_key: str, voice: str, model: str) -> None:
+    """Call OpenAI TTS and resample the raw PCM to an 8kHz mono WAV."""
+    with warnings.catch_warnings():
+        # Deprecated in 3.11+, provided by audioop-lts on 3.13+
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+
+    response = _SESSION.post(
+        _OPENAI_SPEECH_URL,
         headers={
             "Authorization": f"Bearer {openai_api_key}",
             "Content-Type": "application/json",
         },
         json={
-            "model": "tts-1",
+            "model": model,
             "input": text,
             "voice": voice,
-            "response_format": "mp3",
+            # Raw 24kHz mono s16le: no codec to decode, so no ffmpeg needed
+            "response_format": "pcm",
         },
         timeout=60,
     )
     response.raise_for_status()
-    mp3_path.write_bytes(response.content)
-
-    import subprocess
-
-    subprocess.run(
-        [
-            "ffmpeg",
-            "-y",
-            "-loglevel",
-            "error",
-            "-i",
-            str(mp3_path),
-            "-ar",
-            "8000",
-            "-ac",
-            "1",
-            "-sample_fmt",
-            "s16",
-            str(output_path),
-        ],
-        check=True,
-    )
-    mp3_path.unlink(missing_ok=True)
+    # ratecv interpolates without an anti-alias filter; TTS speech carries little
+    # energy above 4kHz, so the folded content is faint at telephone quality
+    pcm8, _ = audioop.ratecv(response.content, 2, 1, 24000, 8000, None)
+    with output_path.open("wb") as fh:
+        fh.write(
+            _WAV_HEADER.pack(b"RIFF", 36 + len(pcm8), b"WAVE", b"fmt ", 16, 1, 1, 8000, 16000, 2, 16, b"data", len(pcm8))
+        )
+        fh.write(pcm8)
+
+
+def _cached_prompt(text: str, cache_dir: Path, openai_api_key: str, voice: str, model: str) -> Path:
+    key = _tts_cache_key(text, voice, model)
+    cached = cache_dir / f"{key}.wav"
+    if cached.exists():
+        log.debug("TTS cache hit: %s", cached)
+        return cached
+
+    # Single-flight: concurrent misses for the same prompt wait on one render
+    with _inflight_lock:
+        future = _inflight_prompts.get(cached)
+        leader = future is None
+        if leader:
+            future = _inflight_prompts[cached] = Future()
+    if not leader:
+        log.debug("Joining in-flight TTS render: %s", cached)
+        return future.result()
+
+    try:
+        # A render may have been published between the first check and the lock
+        if not cached.exists():
+            _render_to_cache(text, cache_dir, cached, openai_api_key, voice, model)
+        future.set_result(cached)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight_prompts[cached]
+    return cached
+
+
+def _render_to_cache(text: str, cache_dir: Path, cached: Path, openai_api_key: str, voice: str, model: str) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{cached.stem}.", suffix=".wav", dir=cache_dir)
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        _render_prompt(text, tmp_path, openai_api_key, voice, model)
+        # Publish atomically so concurrent readers never see a partial file
+        os.replace(tmp_path, cached)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def synthesize_prompt(
+    text: str,
+    output_path: Path,
+    openai_api_key: str,
+    voice: str = "alloy",
+    model: str = "tts-1",
+) -> None:
+    """Generate a WAV prompt using OpenAI TTS.
+
+    Repeated prompts are served from the shared TTS cache (see
+    ``cached_synthesize``) and copied to ``output_path``.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    cached = _cached_prompt(text, _tts_cache_dir(), openai_api_key, voice, model)
+    shutil.copyfile(cached, output_path)
+
+
+def cached_synthesize(
+    text: str,
+    out_dir: Path,
+    openai_api_key: str,
+    voice: str = "alloy",
+    model: str = "tts-1",
+) -> Path:
+    """Return a WAV prompt for ``text``, synthesizing it only on a cache miss.
+
+    Prompts are content-addressed by provider, model, voice, output format and
+    text under ``out_dir/tts_cache`` (or ``$ISIP_TTS_CACHE_DIR`` when set, so
+    several processes can share hits).
+    """
+    return _cached_prompt(text, _tts_cache_dir(out_dir), openai_api_key, voice, model)
+
+
+def clear_tts_cache(out_dir: Optional[Path] = None) -> int:
+    """Delete cached TTS prompts and return how many were removed."""
+    cache_dir = _tts_cache_dir(out_dir)
+    removed = 0
+    for entry in cache_dir.glob("*.wav"):
+        if entry.name.startswith("."):
+            continue  # in-progress render, published by _cached_prompt
+        entry.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def warm_deepgram_connection() -> None:
+    """Open a pooled connection to Deepgram ahead of ``transcribe_recording``.
+
+    Meant to run while a call is in progress so the post-call upload skips
+    the TCP+TLS handshake. Failures are ignored; the real request will retry.
+    """
+    try:
+        _SESSION.head(_DEEPGRAM_LISTEN_URL, timeout=5)
+    except requests.RequestException as exc:
+        log.debug("Deepgram warm-up failed: %s", exc)
+
+
+def _stt_cache_dir() -> Path:
+    """``$ISIP_STT_CACHE_DIR`` if set, else a temp-dir cache."""
+    configured = os.getenv("ISIP_STT_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / "isip_stt_cache"
+
+
+def _file_sha256(path: Path) -> str:
+    stat = path.stat()
+    return _hash_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _hash_file(path: str, mtime_ns: int, size: int) -> str:
+    # mtime and size are part of the cache key so a rewritten file is re-hashed
+    with open(path, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for block in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(block)
+        return digest.hexdigest()
 
 
 def transcribe_recording(audio_path: Path, deepgram_api_key: str) -> str:
-    """Return the transcript using Deepgram."""
-    resp = requests.post(
-        "https://api.deepgram.com/v1/listen?model=nova-2&smart_format=true",
-        headers={
-            "Authorization": f"Token {deepgram_api_key}",
-            "Content-Type": "audio/wav",
-        },
-        data=audio_path.read_bytes(),
+    """Return the transcript using Deepgram.
+
+    Transcripts are cached by the SHA-256 of the recording, so byte-identical
+    responses (e.g. a fixed IVR greeting) are only sent to Deepgram once.
+    """
+    cache_dir = _stt_cache_dir()
+    cached = cache_dir / f"{_file_sha256(audio_path)}.json"
+    if cached.exists():
+        entry = json.loads(cached.read_text())
+        if entry.get("model") == _DEEPGRAM_MODEL:
+            log.debug("STT cache hit: %s", cached)
+            return entry["transcript"]
+
+    transcript = _transcribe_upload(audio_path, deepgram_api_key)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{cached.stem}.", suffix=".json", dir=cache_dir)
+    with os.fdopen(fd, "w") as fh:
+        json.dump({"transcript": transcript, "model": _DEEPGRAM_MODEL}, fh)
+    os.replace(tmp_name, cached)
+    return transcript
+
+
+class _FileChunks:
+    """Request body that streams a file in fixed-size chunks.
+
+    Having no length, it is sent with ``Transfer-Encoding: chunked`` so Deepgram
+    can start decoding while the rest uploads. Unlike a generator it can be
+    iterated again, so urllib3 retries resend the whole file.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = 64 * 1024):
+        self.path = path
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        with self.path.open("rb") as fh:
+            while chunk := fh.read(self.chunk_size):
+                yield chunk
+
+
+class _GzipFileChunks(_FileChunks):
+    """``_FileChunks`` compressed on the fly as a single gzip stream."""
+
+    def __iter__(self) -> Iterator[bytes]:
+        # Level 1 keeps compression well ahead of typical uplink bandwidth
+        compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+        for chunk in super().__iter__():
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+
+def _transcribe_upload(audio_path: Path, deepgram_api_key: str) -> str:
+    # Long recordings are bandwidth-bound on the uplink, so they go up compressed
+    if audio_path.stat().st_size > _GZIP_UPLOAD_THRESHOLD:
+        return _post_audio(_GzipFileChunks(audio_path), deepgram_api_key, {"Content-Encoding": "gzip"})
+    return _post_audio(_FileChunks(audio_path), deepgram_api_key)
+
+
+def _post_audio(body: Iterable[bytes], deepgram_api_key: str, extra_headers: Optional[dict] = None) -> str:
+    headers = {
+        "Authorization": f"Token {deepgram_api_key}",
+        "Content-Type": "audio/wav",
+    }
+    if extra_headers:
+        headers.update(extra_headers)
+    resp = _SESSION.post(
+        _DEEPGRAM_LISTEN_URL,
+        headers=headers,
+        data=body,
         timeout=60,
     )
     resp.raise_for_status()
-    return resp.json()["results"]["channels"][0]["alternatives"][0]["transcript"]
-
-
-class _CallCallback(pj.CallCallback):
-    def __init__(self, scenario: SipScenario, lib: pj.Lib, call: Optional[pj.Call] = None):
-        super().__init__(call)
-        self.scenario = scenario
-        self.lib = lib
-        self.established = False
-        self.done = False
-        self.player_id = None
-        self.recorder_id = None
-        self.start_ts: Optional[float] = None
-
-    def on_state(self):
-        info = self.call.info()
-        log.debug("Call state: %s", info.state_text)
-        if info.state == pj.CallState.CONFIRMED:
-            self.established = True
-            self.start_ts = time.time()
-        if info.state == pj.CallState.DISCONNECTED:
-            self.done = True
-
-    def on_media_state(self):
-        info = self.call.info()
-        if info.media_state == pj.MediaState.ACTIVE:
-            call_slot = info.conf_slot
-            if self.scenario.prompt_file and self.scenario.prompt_file.exists():
-                self.player_id = self.lib.create_player(str(self.scenario.prompt_file), loop=False)
-                player_slot = self.lib.player_get_slot(self.player_id)
-                self.lib.conf_connect(player_slot, call_slot)
-            self.recorder_id = self.lib.create_recorder(str(self.scenario.record_file))
-            recorder_slot = self.lib.recorder_get_slot(self.recorder_id)
-            self.lib.conf_connect(call_slot, recorder_slot)
+    results = orjson.loads(resp.content) if orjson is not None else resp.json()
+    return results["results"]["channels"][0]["alternatives"][0]["transcript"]
+
+
+@lru_cache(maxsize=None)
+def _make_callback_cls(pj):
+    """Build the call callback class once pjsua has been imported."""
+
+    class _CallCallback(pj.CallCallback):
+        def __init__(self, scenario: SipScenario, lib: pj.Lib, call: Optional[pj.Call] = None):
+            super().__init__(call)
+            self.scenario = scenario
+            self.lib = lib
+            self.established = False
+            self.done = False
+            self.done_event = threading.Event()
+            self.player_id = None
+            self.recorder_id = None
+            self.prompt_pending = False
+            self.start_ts: Optional[float] = None
+            # The prompt player is created on the TTS thread but released on the
+            # pjsua event thread, so media setup and teardown are serialized
+            self._media_lock = threading.Lock()
+
+        def on_state(self):
+            info = self.call.info()
+            log.debug("Call state: %s", info.state_text)
+            if info.state == pj.CallState.CONFIRMED:
+                self.established = True
+                self.start_ts = time.monotonic()
+            if info.state == pj.CallState.DISCONNECTED:
+                with self._media_lock:
+                    self.done = True
+                    # Destroying the recorder flushes the WAV while the Lib stays alive
+                    self._release_media()
+                self.done_event.set()
+
+        def on_media_state(self):
+            info = self.call.info()
+            if info.media_state == pj.MediaState.ACTIVE:
+                call_slot = info.conf_slot
+                register_prompt = False
+                with self._media_lock:
+                    if self.player_id is None and self.scenario.prompt_file and self.scenario.prompt_file.exists():
+                        self._play_prompt(self.scenario.prompt_file, call_slot)
+                    elif self.scenario.prompt_future is not None and not self.prompt_pending:
+                        # Registered once; re-INVITEs must not add a second player
+                        self.prompt_pending = register_prompt = True
+                    if self.recorder_id is None:
+                        self.recorder_id = self.lib.create_recorder(str(self.scenario.record_file))
+                    recorder_slot = self.lib.recorder_get_slot(self.recorder_id)
+                    self.lib.conf_connect(call_slot, recorder_slot)
+                if register_prompt:
+                    # Outside the lock: runs right here if synthesis already finished
+                    # (and _on_prompt_ready takes the lock), else on the TTS thread
+                    self.scenario.prompt_future.add_done_callback(self._on_prompt_ready)
+
+        def _play_prompt(self, prompt_file: Path, call_slot: int) -> None:
+            self.player_id = self.lib.create_player(str(prompt_file), loop=False)
+            player_slot = self.lib.player_get_slot(self.player_id)
+            self.lib.conf_connect(player_slot, call_slot)
+
+        def _release_media(self) -> None:
+            player_id, self.player_id = self.player_id, None
+            recorder_id, self.recorder_id = self.recorder_id, None
+            if player_id is not None:
+                self.lib.player_destroy(player_id)
+            if recorder_id is not None:
+                self.lib.recorder_destroy(recorder_id)
+
+        def _on_prompt_ready(self, future: Future) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return  # run_scenario hangs up and reports the failure
+            _register_pj_thread(self.lib)
+            with self._media_lock:
+                if self.done:
+                    return
+                try:
+                    # The media may have been renegotiated since the callback was registered
+                    self._play_prompt(future.result(), self.call.info().conf_slot)
+                except pj.Error as exc:  # call may have ended while the prompt was rendering
+                    log.warning("Could not play prompt: %s", exc)
+
+    return _CallCallback
 
 
 class SipTestClient:
-    """Thin wrapper around the pjsua API."""
+    """Thin wrapper around the pjsua API.
+
+    ``run_scenario`` may be called from several threads at once; up to
+    ``max_calls`` scenarios then share the single account concurrently.
+    """
 
     def __init__(
         self,
@@ -136,6 +473,7 @@ class SipTestClient:
         local_ip: Optional[str] = None,
         local_port: int = 5060,
         log_level: int = 3,
+        max_calls: int = 4,
     ):
         self.gateway = gateway
         self.username = username
@@ -143,8 +481,13 @@ class SipTestClient:
         self.local_ip = local_ip
         self.local_port = local_port
         self.log_level = log_level
-        self.lib = pj.Lib()
+        self.max_calls = max_calls
+        self.lib = _get_pj().Lib()
+        # Lib() runs pjsua_create, which registers this thread (an MCP worker, say)
+        _mark_pj_thread(self.lib)
         self.account: Optional[pj.Account] = None
+        self._events_stop = threading.Event()
+        self._events_thread: Optional[threading.Thread] = None
 
     def __enter__(self) -> "SipTestClient":
         self.start()
@@ -154,11 +497,17 @@ class SipTestClient:
         self.stop()
 
     def start(self) -> None:
+        pj = _get_pj()
+        _register_pj_thread(self.lib)
+        self._log_debug = log.isEnabledFor(logging.DEBUG)
+        self._log_info = log.isEnabledFor(logging.INFO)
+        ua_cfg = pj.UAConfig()
+        ua_cfg.max_calls = self.max_calls
         log_cfg = pj.LogConfig(level=self.log_level, callback=self._log_cb)
         media_cfg = pj.MediaConfig()
         # Note: clock_rate must be set after init, not in MediaConfig constructor
         
-        self.lib.init(log_cfg=log_cfg, media_cfg=media_cfg)
+        self.lib.init(ua_cfg=ua_cfg, log_cfg=log_cfg, media_cfg=media_cfg)
         # Set clock rate on the library after init
         # media_cfg.clock_rate = 8000  # This is set globally by PJSIP
         transport = pj.TransportConfig()
@@ -182,7 +531,24 @@ class SipTestClient:
             if self.account.info().online_status:
                 break
 
+        # A single thread services pjsua events so callers can block on call state
+        self._events_stop.clear()
+        self._events_thread = threading.Thread(target=self._event_loop, name="pjsua-events", daemon=True)
+        self._events_thread.start()
+
+    def _event_loop(self) -> None:
+        _register_pj_thread(self.lib)
+        while not self._events_stop.is_set():
+            self.lib.handle_events(100)  # returns early once events are processed
+
     def stop(self) -> None:
+        # The shared client is stopped from atexit or another worker, not always its creator
+        if self.lib:
+            _register_pj_thread(self.lib)
+        if self._events_thread is not None:
+            self._events_stop.set()
+            self._events_thread.join()
+            self._events_thread = None
         if self.account is not None:
             self.account.delete()
             self.account = None
@@ -193,26 +559,44 @@ class SipTestClient:
     def run_scenario(self, scenario: SipScenario) -> CallResult:
         if self.account is None:
             raise RuntimeError("Client not started")
+        _register_pj_thread(self.lib)
 
         uri = f"sip:{scenario.phone}@{self.gateway}"
-        callback = _CallCallback(scenario, self.lib)
+        callback = _make_callback_cls(_get_pj())(scenario, self.lib)
+        deadline = time.monotonic() + scenario.timeout
         call = self.account.make_call(uri, cb=callback)
 
-        deadline = time.time() + scenario.timeout
-        while time.time() < deadline and not callback.done:  # type: ignore[attr-defined]
-            self.lib.handle_events(200)  # 200ms
-
-        if not callback.done:
-            call.hangup()
+        # Synthesis overlaps dialing, but never leave the callee on dead air:
+        # drop the call as soon as the prompt fails or takes too long
+        error = None
+        prompt_future = scenario.prompt_future
+        if prompt_future is not None:
+            prompt_timeout = scenario.prompt_timeout if scenario.prompt_timeout is not None else scenario.timeout
+            if scenario.prompt_started is not None:
+                scenario.prompt_started.wait(max(0.0, deadline - time.monotonic()))
+            wait([prompt_future], timeout=max(0.0, min(prompt_timeout, deadline - time.monotonic())))
+            if not prompt_future.done():
+                error = f"Prompt synthesis timed out after {prompt_timeout:g}s"
+            elif prompt_future.exception() is not None:
+                error = f"Failed to synthesize prompt: {prompt_future.exception()}"
+
+        if error is not None or not callback.done_event.wait(max(0.0, deadline - time.monotonic())):
+            if not callback.done:
+                call.hangup()
+            callback.done_event.wait(5.0)
 
         duration = 0.0
         if callback.start_ts:
-            duration = max(0.0, time.time() - callback.start_ts)
+            duration = max(0.0, time.monotonic() - callback.start_ts)
 
         recording = scenario.record_file if scenario.record_file.exists() else None
-        return CallResult(established=callback.established, recording=recording, duration=duration)
-
-    @staticmethod
-    def _log_cb(level, _, message):
-        log.log(logging.DEBUG if level <= 3 else logging.INFO, "pjsua: %s", message)
+        return CallResult(established=callback.established, recording=recording, duration=duration, error=error)
+
+    def _log_cb(self, level, _, message):
+        # pjsua calls this for every message, so skip the logging machinery when filtered out
+        if level <= 3:
+            if self._log_debug:
+                log.debug("pjsua: %s", message)
+        elif self._log_info:
+            log.info("pjsua: %s", message)
 
@@ -22,16 +22,100 @@ Example usage:
 
 from __future__ import annotations
 
+import atexit
+import itertools
+import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Iterator, Optional, Literal
 from urllib.parse import urlparse
 
-from .client import SipTestClient, SipScenario, CallResult, synthesize_prompt, transcribe_recording
+from .client import (
+    SipTestClient,
+    SipScenario,
+    CallResult,
+    cached_synthesize,
+    transcribe_recording,
+    warm_deepgram_connection,
+)
+from .streaming import DeepgramStreamer, streaming_available
 
+log = logging.getLogger(__name__)
 
-@dataclass
+_DEFAULT_MAX_CALLS = 8
+
+
+class _SharedClient:
+    """The process-wide SipTestClient, kept registered between calls.
+
+    pjsua supports a single Lib per process and does not cope well with
+    repeated init/destroy, so every Sippy borrows this one client. A call for
+    a different account waits for in-flight calls to drain, then replaces it.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._client: Optional[SipTestClient] = None
+        self._key: Optional[tuple] = None
+        self._active = 0
+    
+    @contextmanager
+    def acquire(self, target: SipHeaders, log_level: int, max_calls: int = _DEFAULT_MAX_CALLS) -> Iterator[SipTestClient]:
+        key = _account_key(target) + (log_level,)
+        with self._cond:
+            while self._active and not self._fits(key, max_calls):
+                self._cond.wait()
+            if not self._fits(key, max_calls):
+                self._stop_locked()
+                client = SipTestClient(
+                    gateway=target.gateway,
+                    username=target.auth_user,
+                    password=target.auth_password,
+                    local_ip=target.local_ip,
+                    local_port=target.local_port,
+                    log_level=log_level,
+                    max_calls=max_calls,
+                )
+                client.start()
+                self._client, self._key = client, key
+            self._active += 1
+            client = self._client
+        try:
+            yield client
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+    
+    def close(self) -> None:
+        """Wait for in-flight calls, then unregister and destroy the pjsua Lib."""
+        with self._cond:
+            while self._active:
+                self._cond.wait()
+            self._stop_locked()
+    
+    def _fits(self, key: tuple, max_calls: int) -> bool:
+        return self._client is not None and self._key == key and self._client.max_calls >= max_calls
+    
+    def _stop_locked(self) -> None:
+        client, self._client, self._key = self._client, None, None
+        if client is not None:
+            try:
+                client.stop()
+            except Exception as e:
+                log.warning("Failed to stop SIP client: %s", e)
+
+
+_shared_client = _SharedClient()
+atexit.register(_shared_client.close)
+
+
+@dataclass(slots=True)
 class VoiceService:
     """Configuration for AI voice services (TTS/STT)."""
     
@@ -59,7 +143,17 @@ class VoiceService:
                 )
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _sip_env_defaults() -> tuple[Optional[str], Optional[str], str]:
+    """SIP_USERNAME, SIP_PASSWORD and SIP_GATEWAY, read once per process."""
+    return (
+        os.getenv("SIP_USERNAME"),
+        os.getenv("SIP_PASSWORD"),
+        os.getenv("SIP_GATEWAY", "2g0282esbg2.sip.livekit.cloud"),
+    )
+
+
+@dataclass(slots=True)
 class SipHeaders:
     """SIP connection headers and authentication."""
     
@@ -74,27 +168,29 @@ class SipHeaders:
     
     def __post_init__(self):
         """Parse SIP URI and extract components."""
-        # Parse the sip_to URI
-        if self.sip_to.startswith("sip:"):
-            uri = self.sip_to[4:]  # Remove "sip:" prefix
-            if "@" in uri:
-                phone_part, gateway_part = uri.split("@", 1)
+        # Parse the sip_to URI: sip:<phone>@<gateway>
+        sip_to = self.sip_to
+        if sip_to[:4] == "sip:":
+            at = sip_to.find("@", 4)
+            if at != -1:
                 if self.phone is None:
-                    self.phone = phone_part
+                    self.phone = sip_to[4:at]
                 if self.gateway is None:
-                    self.gateway = gateway_part
+                    self.gateway = sip_to[at + 1:]
         
         # Use sip_from as default auth_user if not specified
         if self.auth_user is None and self.sip_from:
             self.auth_user = self.sip_from
         
         # Load from environment if still missing
-        if self.auth_user is None:
-            self.auth_user = os.getenv("SIP_USERNAME")
-        if self.auth_password is None:
-            self.auth_password = os.getenv("SIP_PASSWORD")
-        if self.gateway is None:
-            self.gateway = os.getenv("SIP_GATEWAY", "2g0282esbg2.sip.livekit.cloud")
+        if self.auth_user is None or self.auth_password is None or self.gateway is None:
+            env_user, env_password, env_gateway = _sip_env_defaults()
+            if self.auth_user is None:
+                self.auth_user = env_user
+            if self.auth_password is None:
+                self.auth_password = env_password
+            if self.gateway is None:
+                self.gateway = env_gateway
         
         # Validation
         if not self.gateway:
@@ -107,7 +203,7 @@ class SipHeaders:
             raise ValueError("Authentication password required (set SIP_PASSWORD or pass auth_password)")
 
 
-@dataclass
+@dataclass(slots=True)
 class CallResponse:
     """Result of a SIP call."""
     
@@ -123,6 +219,26 @@ class CallResponse:
         return self.established and self.error is None
 
 
+@dataclass(slots=True)
+class _PendingCall:
+    """A prepared call awaiting dialing and transcription."""
+    
+    scenario: SipScenario
+    prompt_file: Optional[Path]
+    prompt_future: Optional[Future]
+    transcribe: bool
+    streamer: Optional[DeepgramStreamer] = None
+
+
+def _account_key(target: SipHeaders) -> tuple:
+    """Calls with the same key can share one SIP registration."""
+    return (target.gateway, target.auth_user, target.auth_password, target.local_ip, target.local_port)
+
+
+def _call_failed(exc: BaseException) -> CallResponse:
+    return CallResponse(established=False, duration=0.0, error=f"Call failed: {exc}")
+
+
 class Sippy:
     """High-level SIP testing client with AI voice integration."""
     
@@ -132,6 +248,7 @@ class Sippy:
         transcription_service: Optional[VoiceService] = None,
         output_dir: Optional[Path] = None,
         log_level: int = 3,
+        stream_transcription: bool = False,
     ):
         """
         Initialize Sippy client.
@@ -141,13 +258,39 @@ class Sippy:
             transcription_service: STT service for transcribing responses (Deepgram)
             output_dir: Directory for storing recordings and prompts
             log_level: PJSIP log level (0-5, higher = more verbose)
+            stream_transcription: Opt in to transcribing Deepgram responses live during
+                the call (requires the ``streaming`` extra; falls back to a post-call
+                upload). Live transcripts bypass the transcript cache.
         """
         self.voice_service = voice_service
         self.transcription_service = transcription_service
         self.output_dir = output_dir or Path.cwd() / "sippy_output"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.log_level = log_level
-        self._call_counter = 0
+        self.stream_transcription = stream_transcription
+        self._call_ids = itertools.count(1)
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sippy-tts")
+        # Separate worker so STT warm-ups never hold up prompt renders
+        self._warm_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sippy-warm")
+        self._warmup: Optional[Future] = None
+    
+    def __enter__(self) -> "Sippy":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Unregister from the SIP gateway and stop background workers.
+        
+        The SIP client stays registered between calls and is shared by every
+        Sippy in the process, so this waits for their in-flight calls first.
+        It also runs automatically at interpreter exit.
+        """
+        self._pool.shutdown(wait=True)
+        self._warm_pool.shutdown(wait=True)
+        _shared_client.close()
     
     def call(
         self,
@@ -156,6 +299,7 @@ class Sippy:
         prompt_file: Optional[Path] = None,
         timeout: float = 30.0,
         transcribe: bool = True,
+        prompt_timeout: Optional[float] = None,
     ) -> CallResponse:
         """
         Make a SIP call to the target.
@@ -166,14 +310,107 @@ class Sippy:
             prompt_file: Pre-recorded audio file to play
             timeout: Call timeout in seconds
             transcribe: Whether to transcribe the response (requires transcription_service)
+            prompt_timeout: Seconds to wait for prompt synthesis once it starts before
+                hanging up (defaults to ``timeout``)
         
         Returns:
             CallResponse with call details and transcript
         """
-        self._call_counter += 1
-        call_id = f"call_{self._call_counter:03d}"
+        pending = self._prepare(target, prompt, prompt_file, timeout, transcribe, prompt_timeout)
+        if isinstance(pending, CallResponse):
+            return pending
+        
+        # Execute call
+        try:
+            with _shared_client.acquire(target, self.log_level) as client:
+                result = self._run(client, pending)
+        except Exception as e:
+            return _call_failed(e)
+        
+        return self._finish(pending, result)
+    
+    def call_many(
+        self,
+        items: list[tuple[SipHeaders, Optional[str]]],
+        timeout: float = 30.0,
+        transcribe: bool = True,
+        max_parallel: int = 4,
+        prompt_timeout: Optional[float] = None,
+    ) -> list[CallResponse]:
+        """
+        Make several SIP calls, registering once per SIP account.
         
-        # Prepare prompt file
+        Calls that share an account run concurrently over a single registration.
+        Different accounts are dialed one group after another, since pjsua supports
+        one SIP stack per process. Finished calls are transcribed while the
+        remaining calls are still in progress.
+        
+        Args:
+            items: (target, prompt) pairs; prompt may be None to only record
+            timeout: Per-call timeout in seconds
+            transcribe: Whether to transcribe the responses
+            max_parallel: Maximum number of simultaneous calls and transcriptions
+            prompt_timeout: Per-call wait for prompt synthesis once it starts
+                (defaults to ``timeout``)
+        
+        Returns:
+            One CallResponse per item, in the same order as ``items``
+        """
+        max_parallel = max(1, max_parallel)
+        responses: list[Optional[CallResponse]] = [None] * len(items)
+        
+        # Prompts for every call start synthesizing before the first one is dialed
+        groups: dict[tuple, list[tuple[int, _PendingCall]]] = {}
+        for index, (target, prompt) in enumerate(items):
+            pending = self._prepare(target, prompt, None, timeout, transcribe, prompt_timeout)
+            if isinstance(pending, CallResponse):
+                responses[index] = pending
+            else:
+                groups.setdefault(_account_key(target), []).append((index, pending))
+        
+        finishing: dict[int, Future] = {}
+        with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="sippy-call") as call_pool, \
+                ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="sippy-stt") as stt_pool:
+            for calls in groups.values():
+                target = items[calls[0][0]][0]
+                try:
+                    with _shared_client.acquire(
+                        target, self.log_level, max_calls=max(max_parallel, _DEFAULT_MAX_CALLS)
+                    ) as client:
+                        running = [call_pool.submit(self._run, client, pending) for _, pending in calls]
+                        wait(running)
+                except Exception as e:
+                    for index, _ in calls:
+                        responses[index] = _call_failed(e)
+                    continue
+                
+                for (index, pending), future in zip(calls, running):
+                    if future.exception() is not None:
+                        responses[index] = _call_failed(future.exception())
+                    else:
+                        finishing[index] = stt_pool.submit(self._finish, pending, future.result())
+            
+            for index, future in finishing.items():
+                responses[index] = future.result()
+        
+        return responses
+    
+    def _prepare(
+        self,
+        target: SipHeaders,
+        prompt: Optional[str],
+        prompt_file: Optional[Path],
+        timeout: float,
+        transcribe: bool,
+        prompt_timeout: Optional[float] = None,
+    ) -> _PendingCall | CallResponse:
+        """Build the scenario for a call, or return an error response."""
+        call_id = f"call_{next(self._call_ids):03d}"
+        
+        # Prepare prompt file; synthesis overlaps SIP setup and the prompt
+        # starts playing once both the call media and the audio are ready
+        prompt_future: Optional[Future] = None
+        prompt_started: Optional[threading.Event] = None
         if prompt and not prompt_file:
             if not self.voice_service:
                 return CallResponse(
@@ -181,16 +418,10 @@ class Sippy:
                     duration=0.0,
                     error="Voice service required for text-to-speech. Pass voice_service to Sippy().",
                 )
-            
-            prompt_file = self.output_dir / f"{call_id}_prompt.wav"
-            try:
-                self._synthesize_prompt(prompt, prompt_file)
-            except Exception as e:
-                return CallResponse(
-                    established=False,
-                    duration=0.0,
-                    error=f"Failed to synthesize prompt: {e}",
-                )
+            # The prompt timeout counts from here, not from time spent queued
+            prompt_started = threading.Event()
+            prompt_future = self._pool.submit(self._synthesize_started, prompt, prompt_started)
+            prompt_future.add_done_callback(lambda _: prompt_started.set())  # e.g. cancelled at shutdown
         
         # Prepare recording file
         record_file = self.output_dir / f"{call_id}_response.wav"
@@ -201,36 +432,59 @@ class Sippy:
             prompt_file=prompt_file,
             record_file=record_file,
             timeout=timeout,
+            prompt_future=prompt_future,
+            prompt_timeout=prompt_timeout,
+            prompt_started=prompt_started,
+        )
+        return _PendingCall(
+            scenario=scenario,
+            prompt_file=prompt_file,
+            prompt_future=prompt_future,
+            transcribe=transcribe,
         )
+    
+    def _run(self, client: SipTestClient, pending: _PendingCall) -> CallResult:
+        """Place a prepared call on a started client."""
+        # Transcribe live while the call runs, or at least warm the STT connection
+        stt = self.transcription_service
+        if pending.transcribe and stt and stt.provider == "deepgram":
+            if self.stream_transcription and streaming_available():
+                record_file = pending.scenario.record_file
+                # Don't tail a stale recording left over from an earlier run
+                record_file.unlink(missing_ok=True)
+                pending.streamer = DeepgramStreamer(record_file, stt.api_key)
+                pending.streamer.start()
+            else:
+                self._warm_deepgram()
         
-        # Execute call
         try:
-            with SipTestClient(
-                gateway=target.gateway,
-                username=target.auth_user,
-                password=target.auth_password,
-                local_ip=target.local_ip,
-                local_port=target.local_port,
-                log_level=self.log_level,
-            ) as client:
-                result = client.run_scenario(scenario)
-        except Exception as e:
-            return CallResponse(
-                established=False,
-                duration=0.0,
-                error=f"Call failed: {e}",
-            )
+            return client.run_scenario(pending.scenario)
+        except Exception:
+            if pending.streamer is not None:
+                pending.streamer.abort()
+            raise
+    
+    def _warm_deepgram(self) -> None:
+        # One warm-up at a time is enough to keep a pooled connection open
+        if self._warmup is None or self._warmup.done():
+            self._warmup = self._warm_pool.submit(warm_deepgram_connection)
+    
+    def _finish(self, pending: _PendingCall, result: CallResult) -> CallResponse:
+        """Collect the prompt outcome and transcript for a completed call."""
+        # run_scenario reports a failed or timed-out prompt (and hangs up) itself
+        error = result.error
+        prompt_file = pending.prompt_file
+        prompt_future = pending.prompt_future
+        if prompt_future is not None and prompt_future.done() and prompt_future.exception() is None:
+            prompt_file = prompt_future.result()
         
-        # Transcribe response
+        # Transcribe response; a call dropped for a bad prompt has nothing worth transcribing
         transcript = None
-        if transcribe and result.recording and result.recording.exists():
-            if not self.transcription_service:
-                transcript = "[transcription service not configured]"
-            else:
-                try:
-                    transcript = self._transcribe_recording(result.recording)
-                except Exception as e:
-                    transcript = f"[transcription failed: {e}]"
+        if error is not None:
+            if pending.streamer is not None:
+                pending.streamer.abort()
+        else:
+            transcript = self._collect_transcript(pending, result)
         
         return CallResponse(
             established=result.established,
@@ -238,14 +492,35 @@ class Sippy:
             recording=result.recording,
             transcript=transcript,
             prompt_file=prompt_file,
+            error=error,
         )
     
-    def _synthesize_prompt(self, text: str, output_path: Path) -> None:
-        """Generate audio prompt using configured voice service."""
+    def _collect_transcript(self, pending: _PendingCall, result: CallResult) -> Optional[str]:
+        """Finish live transcription, falling back to uploading the recording."""
+        if pending.streamer is not None:
+            try:
+                return pending.streamer.finish()
+            except Exception as e:
+                log.warning("Live transcription unavailable, uploading recording instead: %s", e)
+        if not (pending.transcribe and result.recording and result.recording.exists()):
+            return None
+        if not self.transcription_service:
+            return "[transcription service not configured]"
+        try:
+            return self._transcribe_recording(result.recording)
+        except Exception as e:
+            return f"[transcription failed: {e}]"
+    
+    def _synthesize_started(self, text: str, started: threading.Event) -> Path:
+        started.set()
+        return self._synthesize_cached(text)
+    
+    def _synthesize_cached(self, text: str) -> Path:
+        """Return a (possibly cached) audio prompt from the configured voice service."""
         if self.voice_service.provider == "openai":
-            synthesize_prompt(
+            return cached_synthesize(
                 text=text,
-                output_path=output_path,
+                out_dir=self.output_dir,
                 openai_api_key=self.voice_service.api_key,
                 voice=self.voice_service.voice,
             )
@@ -293,7 +568,7 @@ def quick_call(
     sippy = Sippy(voice_service=openai, transcription_service=deepgram)
     
     target = SipHeaders(
-        sip_to=f"sip:{phone}@{gateway or os.getenv('SIP_GATEWAY', '2g0282esbg2.sip.livekit.cloud')}",
+        sip_to=f"sip:{phone}@{gateway or _sip_env_defaults()[2]}",
         auth_user=username,
         auth_password=password,
     )
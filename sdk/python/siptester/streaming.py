@@ -0,0 +1,130 @@
+"""Live transcription of a call recording while it is still being written."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import Optional
+
+_DEEPGRAM_LIVE_URL = (
+    "wss://api.deepgram.com/v1/listen?model=nova-2&smart_format=true"
+    "&encoding=linear16&sample_rate={sample_rate}&channels=1"
+)
+_WAV_HEADER_SIZE = 44  # pjmedia writes a canonical PCM header before the samples
+_KEEPALIVE_INTERVAL = 5.0  # Deepgram drops sockets after ~10s without audio
+
+
+def streaming_available() -> bool:
+    """Return True if the optional ``websockets`` dependency is installed."""
+    try:
+        import websockets.asyncio.client  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class DeepgramStreamer:
+    """Tail a growing PCM WAV file and transcribe it over Deepgram's live WebSocket.
+
+    ``start()`` before the call begins recording; ``finish()`` once the call has
+    ended (and the recorder has flushed) to send the remaining audio and collect
+    the final transcript.
+    """
+
+    def __init__(
+        self,
+        audio_path: Path,
+        deepgram_api_key: str,
+        sample_rate: int = 8000,
+        chunk_ms: int = 20,
+    ):
+        self.audio_path = audio_path
+        self.deepgram_api_key = deepgram_api_key
+        self.sample_rate = sample_rate
+        self.chunk_ms = chunk_ms
+        self._finals: list[str] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        if not streaming_available():
+            raise RuntimeError("Live transcription requires websockets. Install with: pip install 'siptester[streaming]'")
+        self._thread = threading.Thread(target=self._thread_main, name="deepgram-stream", daemon=True)
+        self._thread.start()
+
+    def finish(self, timeout: float = 10.0) -> str:
+        """Flush the rest of the recording and return the joined final transcripts."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                raise TimeoutError("Deepgram did not finalize the transcript in time")
+        if self._error is not None:
+            raise RuntimeError(f"Live transcription failed: {self._error}") from self._error
+        return " ".join(self._finals)
+
+    def abort(self) -> None:
+        """Stop streaming without waiting for a transcript."""
+        self._stop.set()
+
+    def _thread_main(self) -> None:
+        try:
+            asyncio.run(self._run())
+        except BaseException as exc:  # surfaced to the caller by finish()
+            self._error = exc
+
+    async def _run(self) -> None:
+        from websockets.asyncio.client import connect
+
+        url = _DEEPGRAM_LIVE_URL.format(sample_rate=self.sample_rate)
+        headers = {"Authorization": f"Token {self.deepgram_api_key}"}
+        async with connect(url, additional_headers=headers) as ws:
+            receiver = asyncio.create_task(self._receive(ws))
+            await self._send_audio(ws)
+            # Ask Deepgram to flush pending results; it closes the socket afterwards
+            await ws.send(json.dumps({"type": "CloseStream"}))
+            await receiver
+
+    async def _send_audio(self, ws) -> None:
+        poll = self.chunk_ms / 1000
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+        fh = None
+        pending = b""
+        try:
+            while True:
+                stopping = self._stop.is_set()
+                # The recorder only creates the file once call media is up
+                if fh is None and self.audio_path.exists():
+                    fh = self.audio_path.open("rb")
+                    fh.seek(_WAV_HEADER_SIZE)
+                if fh is not None:
+                    pending += fh.read()
+                # Only send whole 16-bit samples
+                usable = len(pending) - (len(pending) % 2)
+                if usable:
+                    await ws.send(pending[:usable])
+                    pending = pending[usable:]
+                    last_sent = loop.time()
+                elif loop.time() - last_sent > _KEEPALIVE_INTERVAL:
+                    await ws.send(json.dumps({"type": "KeepAlive"}))
+                    last_sent = loop.time()
+                if stopping:
+                    # One final read after stop so audio flushed at hangup is included
+                    return
+                await asyncio.sleep(poll)
+        finally:
+            if fh is not None:
+                fh.close()
+
+    async def _receive(self, ws) -> None:
+        async for message in ws:
+            data = json.loads(message)
+            if data.get("type") != "Results" or not data.get("is_final"):
+                continue
+            transcript = data["channel"]["alternatives"][0]["transcript"]
+            if transcript:
+                self._finals.append(transcript)
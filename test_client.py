@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the siptester client helpers.
+
+HTTP is mocked at the shared session, so these need no API keys, network or
+PJSIP. Run with: pytest test_client.py
+"""
+
+import gzip
+import json
+import os
+import sys
+import threading
+import types
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+# Add to path
+sys.path.insert(0, str(Path(__file__).parent / "sdk" / "python"))
+
+from siptester import cli, client
+
+
+class FakeResponse:
+    """Stand-in for a requests.Response from OpenAI TTS."""
+
+    def __init__(self, content: bytes = b"\x00\x00" * 2400, status_error: Exception | None = None):
+        self.content = content
+        self.status_error = status_error
+
+    def raise_for_status(self):
+        if self.status_error is not None:
+            raise self.status_error
+
+
+@pytest.fixture
+def tts_cache(tmp_path, monkeypatch):
+    """Point the TTS cache at a temp dir and return it."""
+    cache_dir = tmp_path / "tts_cache"
+    monkeypatch.setenv("ISIP_TTS_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+def test_cache_hit_skips_second_render(tts_cache, tmp_path, monkeypatch):
+    posts = []
+    monkeypatch.setattr(client._SESSION, "post", lambda *a, **kw: posts.append(kw) or FakeResponse())
+
+    first = client.cached_synthesize("Hello there", tmp_path, "key")
+    second = client.cached_synthesize("Hello there", tmp_path, "key")
+
+    assert first == second
+    assert first.parent == tts_cache
+    assert len(posts) == 1
+    # A different voice is a different cache entry
+    client.cached_synthesize("Hello there", tmp_path, "key", voice="nova")
+    assert len(posts) == 2
+
+
+def test_concurrent_callers_share_one_render(tts_cache, tmp_path, monkeypatch):
+    render_started = threading.Event()
+    release_render = threading.Event()
+    posts = []
+
+    def slow_post(*args, **kwargs):
+        posts.append(kwargs)
+        render_started.set()
+        release_render.wait(5)
+        return FakeResponse()
+
+    monkeypatch.setattr(client._SESSION, "post", slow_post)
+
+    results = []
+    callers = [
+        threading.Thread(target=lambda: results.append(client.cached_synthesize("Same text", tmp_path, "key")))
+        for _ in range(4)
+    ]
+    callers[0].start()
+    assert render_started.wait(5)
+    inflight = dict(client._inflight_prompts)
+    assert len(inflight) == 1
+    for caller in callers[1:]:
+        caller.start()
+
+    # Followers wait on the leader's Future rather than rendering themselves
+    assert dict(client._inflight_prompts) == inflight
+    release_render.set()
+    for caller in callers:
+        caller.join(5)
+
+    assert len(posts) == 1
+    assert len(results) == 4 and len(set(results)) == 1
+    assert next(iter(inflight.values())).result() == results[0]
+    assert client._inflight_prompts == {}
+
+
+def test_failed_render_leaves_no_partial_file(tts_cache, tmp_path, monkeypatch):
+    error = RuntimeError("401 Unauthorized")
+    monkeypatch.setattr(client._SESSION, "post", lambda *a, **kw: FakeResponse(status_error=error))
+
+    with pytest.raises(RuntimeError, match="401"):
+        client.cached_synthesize("Broken prompt", tmp_path, "bad-key")
+
+    assert list(tts_cache.iterdir()) == []
+    assert client._inflight_prompts == {}
+
+    # The next attempt renders again instead of joining a dead Future
+    monkeypatch.setattr(client._SESSION, "post", lambda *a, **kw: FakeResponse())
+    assert client.cached_synthesize("Broken prompt", tmp_path, "good-key").exists()
+
+
+def test_cli_keeps_prompt_copy_for_keyless_reruns(tts_cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(client._SESSION, "post", lambda *a, **kw: FakeResponse(b"\x01\x00" * 2400))
+    target = tmp_path / "artifacts" / "prompt.wav"
+    target.parent.mkdir()
+
+    assert cli._synthesize_to("Hello there", target.parent, target, "key") == target
+    assert target.read_bytes() == client.cached_synthesize("Hello there", target.parent, "key").read_bytes()
+
+
+class FakeDeepgramResponse:
+    """Stand-in for a requests.Response from Deepgram's listen endpoint."""
+
+    def __init__(self, transcript: str):
+        self.content = json.dumps(
+            {"results": {"channels": [{"alternatives": [{"transcript": transcript}]}]}}
+        ).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+@pytest.fixture
+def stt_uploads(tmp_path, monkeypatch):
+    """Point the STT cache at a temp dir and record every upload."""
+    monkeypatch.setenv("ISIP_STT_CACHE_DIR", str(tmp_path / "stt_cache"))
+    uploads = []
+
+    def fake_post(url, data=None, **kwargs):
+        body = b"".join(data)
+        uploads.append(body)
+        return FakeDeepgramResponse(f"transcript {len(uploads)}")
+
+    monkeypatch.setattr(client._SESSION, "post", fake_post)
+    return uploads
+
+
+def test_identical_recording_hits_transcript_cache(stt_uploads, tmp_path):
+    recording = tmp_path / "call_001_response.wav"
+    recording.write_bytes(b"RIFF" + b"\x01" * 1000)
+
+    assert client.transcribe_recording(recording, "key") == "transcript 1"
+    assert client.transcribe_recording(recording, "key") == "transcript 1"
+    # Same bytes under another name (e.g. the next run's recording) is also a hit
+    copy = tmp_path / "call_002_response.wav"
+    copy.write_bytes(recording.read_bytes())
+    assert client.transcribe_recording(copy, "key") == "transcript 1"
+    assert len(stt_uploads) == 1
+
+
+def test_rewritten_recording_misses_transcript_cache(stt_uploads, tmp_path):
+    recording = tmp_path / "response.wav"
+    recording.write_bytes(b"RIFF" + b"\x01" * 1000)
+    assert client.transcribe_recording(recording, "key") == "transcript 1"
+
+    # New size and mtime
+    recording.write_bytes(b"RIFF" + b"\x02" * 2000)
+    assert client.transcribe_recording(recording, "key") == "transcript 2"
+
+    # Same size, new mtime: the memoized digest must not be reused
+    stat = recording.stat()
+    recording.write_bytes(b"RIFF" + b"\x03" * 2000)
+    os.utime(recording, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert client.transcribe_recording(recording, "key") == "transcript 3"
+    assert stt_uploads == [b"RIFF" + b"\x01" * 1000, b"RIFF" + b"\x02" * 2000, b"RIFF" + b"\x03" * 2000]
+
+
+def test_upload_bodies_can_be_resent(tmp_path):
+    recording = tmp_path / "long_call.wav"
+    recording.write_bytes(os.urandom(300 * 1024))
+    original = recording.read_bytes()
+
+    # Each pass is what urllib3 sends on one attempt; a retry iterates again
+    plain = client._FileChunks(recording)
+    assert b"".join(plain) == original
+    assert b"".join(plain) == original
+    assert max(len(chunk) for chunk in plain) == 64 * 1024
+
+    compressed = client._GzipFileChunks(recording)
+    assert gzip.decompress(b"".join(compressed)) == original
+    assert gzip.decompress(b"".join(compressed)) == original
+
+
+@pytest.mark.parametrize(
+    ("size", "body_type", "encoding"),
+    [
+        (client._GZIP_UPLOAD_THRESHOLD, client._FileChunks, None),
+        (client._GZIP_UPLOAD_THRESHOLD + 1, client._GzipFileChunks, "gzip"),
+    ],
+)
+def test_gzip_threshold_selects_body_and_header(tmp_path, monkeypatch, size, body_type, encoding):
+    sent = {}
+
+    def fake_post(url, headers=None, data=None, **kwargs):
+        sent.update(headers=headers, data=data)
+        return FakeDeepgramResponse("ok")
+
+    monkeypatch.setattr(client._SESSION, "post", fake_post)
+    recording = tmp_path / "response.wav"
+    recording.write_bytes(b"\x00" * size)
+
+    assert client._transcribe_upload(recording, "key") == "ok"
+    assert type(sent["data"]) is body_type
+    assert sent["headers"].get("Content-Encoding") == encoding
+    assert sent["headers"]["Content-Type"] == "audio/wav"
+
+
+class StubLib:
+    """Records the media calls the call callback makes on a pjsua Lib."""
+
+    def __init__(self):
+        self.players = []
+        self.recorders = []
+        self.connections = []
+        self.registered = []
+
+    def create_player(self, path, loop=False):
+        self.players.append(path)
+        return len(self.players)
+
+    def player_get_slot(self, player_id):
+        return 100 + player_id
+
+    def create_recorder(self, path):
+        self.recorders.append(path)
+        return len(self.recorders)
+
+    def recorder_get_slot(self, recorder_id):
+        return 200 + recorder_id
+
+    def conf_connect(self, src, dst):
+        self.connections.append((src, dst))
+
+    def thread_register(self, name):
+        self.registered.append(name)
+
+    def destroy(self):
+        pass
+
+
+class StubCall:
+    def info(self):
+        return types.SimpleNamespace(media_state="active", conf_slot=7, state=None, state_text="")
+
+
+@pytest.fixture
+def stub_pj(monkeypatch):
+    """Install a minimal pjsua stand-in so the call callback can run without PJSIP."""
+    pj = types.ModuleType("pjsua")
+    pj.CallCallback = type("CallCallback", (), {"__init__": lambda self, call=None: setattr(self, "call", call)})
+    pj.CallState = types.SimpleNamespace(CONFIRMED="confirmed", DISCONNECTED="disconnected")
+    pj.MediaState = types.SimpleNamespace(ACTIVE="active")
+    pj.Error = type("Error", (Exception,), {})
+    monkeypatch.setattr(client, "_pj", pj)
+    return pj
+
+
+def test_media_up_with_finished_prompt_plays_it_inline(stub_pj, tmp_path):
+    # TTS cache hits (and fast renders) finish before the callee answers
+    prompt = Future()
+    prompt.set_result(tmp_path / "prompt.wav")
+    scenario = client.SipScenario(phone="+15551230000", record_file=tmp_path / "rec.wav", prompt_future=prompt)
+    lib = StubLib()
+    callback = client._make_callback_cls(stub_pj)(scenario, lib, StubCall())
+
+    media = threading.Thread(target=callback.on_media_state, daemon=True)
+    media.start()
+    media.join(5)
+
+    assert not media.is_alive(), "on_media_state deadlocked on its own media lock"
+    assert lib.players == [str(tmp_path / "prompt.wav")]
+    assert lib.recorders == [str(tmp_path / "rec.wav")]
+    assert (101, 7) in lib.connections and (7, 201) in lib.connections
+
+    # A re-INVITE brings media up again without adding a second player
+    callback.on_media_state()
+    assert len(lib.players) == 1
+
+
+class StubAccount:
+    """Dials a StubCall and ends it when the test says so."""
+
+    def __init__(self):
+        self.callback = None
+        self.hung_up = threading.Event()
+
+    def make_call(self, uri, cb=None):
+        self.callback = cb
+        account = self
+
+        class DialedCall(StubCall):
+            def hangup(self):
+                account.hung_up.set()
+                account.end_call()
+
+        return DialedCall()
+
+    def end_call(self):
+        self.callback.done = True
+        self.callback.done_event.set()
+
+
+def _stub_client(stub_pj):
+    stub_pj.Lib = StubLib
+    sip = client.SipTestClient(gateway="sip.example.com", username="tester")
+    sip.account = StubAccount()
+    return sip
+
+
+def test_prompt_timeout_counts_from_render_start(stub_pj, tmp_path):
+    sip = _stub_client(stub_pj)
+    prompt, started = Future(), threading.Event()
+    scenario = client.SipScenario(
+        phone="+15551230000",
+        record_file=tmp_path / "rec.wav",
+        timeout=5.0,
+        prompt_future=prompt,
+        prompt_timeout=0.3,
+        prompt_started=started,
+    )
+
+    # Queued behind other renders for longer than prompt_timeout, then renders quickly
+    threading.Timer(0.5, started.set).start()
+    threading.Timer(0.6, prompt.set_result, (tmp_path / "prompt.wav",)).start()
+    threading.Timer(0.8, sip.account.end_call).start()
+    result = sip.run_scenario(scenario)
+
+    assert result.error is None
+    assert not sip.account.hung_up.is_set()
+
+
+def test_stalled_render_hangs_up_after_prompt_timeout(stub_pj, tmp_path):
+    sip = _stub_client(stub_pj)
+    started = threading.Event()
+    started.set()
+    scenario = client.SipScenario(
+        phone="+15551230000",
+        record_file=tmp_path / "rec.wav",
+        timeout=5.0,
+        prompt_future=Future(),
+        prompt_timeout=0.2,
+        prompt_started=started,
+    )
+
+    result = sip.run_scenario(scenario)
+
+    assert sip.account.hung_up.is_set()
+    assert result.error == "Prompt synthesis timed out after 0.2s"
+
+
+def test_client_built_off_main_thread_registers_stopping_thread(stub_pj):
+    stub_pj.Lib = StubLib
+    built = []
+    worker = threading.Thread(
+        target=lambda: built.append(client.SipTestClient("sip.example.com", "tester")), name="sip-call_0"
+    )
+    worker.start()
+    worker.join(5)
+    sip = built[0]
+    lib = sip.lib
+
+    # e.g. atexit on the main thread; the creating worker was never registered explicitly
+    sip.stop()
+
+    assert lib.registered == [threading.current_thread().name]
@@ -7,7 +7,6 @@ Tests the complete flow: TTS → SIP → Recording → Transcription
 import os
 import sys
 from pathlib import Path
-from datetime import datetime
 
 # Load environment
 try:
@@ -69,12 +68,10 @@ def test_tts_generation():
         print(f"  Voice: {openai.voice}")
         
         sippy = Sippy(voice_service=openai)
-        test_file = sippy.output_dir / f"e2e_test_{datetime.now():%Y%m%d_%H%M%S}.wav"
         
         print(f"\n  Generating audio prompt...")
-        sippy._synthesize_prompt(
-            "Hello, this is an end to end test of the iSIP system. Please respond if you can hear this message.",
-            test_file
+        test_file = sippy._synthesize_cached(
+            "Hello, this is an end to end test of the iSIP system. Please respond if you can hear this message."
         )
         
         if test_file.exists():
@@ -8,16 +8,83 @@ This simulates what an MCP client (like Claude Desktop) would do:
 3. List recordings
 4. Get transcript
 5. Test resources
+
+test_start_call_lifecycle runs offline against a stubbed Sippy.call.
 """
 
 import asyncio
 import sys
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add to path
 sys.path.insert(0, str(Path(__file__).parent / "mcp-server-isip" / "src"))
 
-from mcp_server_isip.server import app, state, list_tools, call_tool
+from mcp_server_isip import server
+from mcp_server_isip.server import app, state, list_tools, call_tool, CallResponse
+
+
+class StubSippy:
+    """Sippy stand-in whose call() blocks until the test releases it."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+    def call(self, target, prompt=None, timeout=30.0):
+        self.calls.append((target.phone, prompt, timeout))
+        self.started.set()
+        self.release.wait(5)
+        return CallResponse(established=True, duration=1.5, transcript="Hello from the stub")
+
+
+def _text(result) -> str:
+    return "\n".join(content.text for content in result)
+
+
+def test_start_call_lifecycle():
+    """start_call returns at once; get_call_status moves the result into state.calls."""
+    stub = StubSippy()
+    saved = (state.env_ok, server._make_target)
+    state.env_ok = True
+    state.get_sippy = lambda voice: stub
+    server._make_target = lambda phone: SimpleNamespace(phone=phone)
+    try:
+        started = _text(asyncio.run(call_tool(
+            name="start_call",
+            arguments={"phone": "+15551230000", "prompt": "Stub prompt", "timeout": 12.0},
+        )))
+        assert "Call started" in started, started
+        call_id = int(started.split("Call ID: ")[1].split()[0])
+        assert stub.started.wait(5)
+        assert stub.calls == [("+15551230000", "Stub prompt", 12.0)]
+
+        # Still running: reported as in flight, not yet in history
+        status = _text(asyncio.run(call_tool(name="get_call_status", arguments={"call_id": call_id})))
+        assert f"Call #{call_id} in progress" in status, status
+        in_flight = _text(asyncio.run(call_tool(name="list_in_flight_calls", arguments={})))
+        assert f"Call #{call_id} - +15551230000" in in_flight, in_flight
+        assert call_id not in state.calls_by_id
+
+        stub.release.set()
+        deadline = time.monotonic() + 5
+        while call_id in state._in_flight and time.monotonic() < deadline:
+            status = _text(asyncio.run(call_tool(name="get_call_status", arguments={"call_id": call_id})))
+            time.sleep(0.05)
+
+        assert call_id not in state._in_flight
+        record = state.calls_by_id[call_id]
+        assert record in state.calls
+        assert record.established and record.transcript == "Hello from the stub"
+        assert "in progress" not in status and "Hello from the stub" in status, status
+        assert "No calls in progress" in _text(asyncio.run(call_tool(name="list_in_flight_calls", arguments={})))
+    finally:
+        stub.release.set()
+        state.env_ok, server._make_target = saved
+        del state.get_sippy  # drop the instance override so the method shows through again
 
 
 async def test_mcp_server():
@@ -144,5 +211,7 @@ async def test_mcp_server():
 
 
 if __name__ == "__main__":
+    test_start_call_lifecycle()
+    print("✓ start_call lifecycle (stubbed)")
     asyncio.run(test_mcp_server())
 